@@ -3,7 +3,7 @@ import signal
 import dotenv
 from threading import Event
 
-from src.managers import ProviderFactory, SubdomainManager, DockerEventListener
+from src.managers import ProviderFactory, SubdomainManager, DockerEventListener, AntiEntropyScheduler
 from src.utils.logger import logger
 
 # Handle graceful shutdown
@@ -39,6 +39,18 @@ def main():
         subdomain_manager = SubdomainManager(provider=provider)
         logger.debug("Creating Docker event listener instance...")
         docker_event_listener = DockerEventListener(subdomain_manager=subdomain_manager, base_url=docker_base_url)
+        sweep_interval = float(os.getenv('DNM_SWEEP_INTERVAL', '3600'))
+        anti_entropy_scheduler = None
+        if sweep_interval > 0:
+            logger.debug("Creating anti-entropy scheduler instance...")
+            anti_entropy_scheduler = AntiEntropyScheduler(
+                provider=provider,
+                base_url=docker_base_url,
+                interval=sweep_interval,
+                jitter=float(os.getenv('DNM_SWEEP_JITTER', '300')),
+                budget=int(os.getenv('DNM_SWEEP_BUDGET', '20')),
+                page_size=int(os.getenv('DNM_SWEEP_PAGE_SIZE', '100'))
+            )
         logger.info("Instances created successfully.")
 
         # subdomain = 'test'
@@ -57,6 +69,13 @@ def main():
         logger.error(f"Error starting Docker event listener: {e}")
         return
 
+    if anti_entropy_scheduler:
+        try:
+            anti_entropy_scheduler.start()
+        except Exception as e:
+            logger.error(f"Error starting anti-entropy scheduler: {e}")
+            return
+
     # Set up signal handlers
     logger.debug("Setting up signal handlers...")
     signal.signal(signal.SIGTERM, handle_stop_signal)
@@ -1,6 +1,7 @@
+from src.managers.anti_entropy_scheduler import AntiEntropyScheduler
 from src.managers.docker_event_listener import DockerEventListener
 from src.managers.provider_factory import ProviderFactory
 from src.managers.subdomain_manager import SubdomainManager
 
 
-__all__ = [SubdomainManager, DockerEventListener, ProviderFactory]
+__all__ = [SubdomainManager, DockerEventListener, ProviderFactory, AntiEntropyScheduler]
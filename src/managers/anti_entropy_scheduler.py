@@ -0,0 +1,114 @@
+import random
+from typing import AnyStr, List, Set
+from threading import Thread, Event
+
+import docker
+
+from src.utils.logger import logger
+from src.utils.validators import extract_host, extract_subdomain
+from src.providers.abstract import SubdomainProvider
+from src.managers.docker_event_listener import RULE_LABEL
+
+
+class AntiEntropyScheduler:
+    def __init__(
+            self,
+            provider: SubdomainProvider,
+            base_url: str = 'unix://var/run/docker.sock',
+            interval: float = 3600,
+            jitter: float = 300,
+            budget: int = 20,
+            page_size: int = 100
+    ):
+        logger.debug("Initializing AntiEntropyScheduler...")
+        if budget < 1 or page_size < 1:
+            raise ValueError(f"Sweep budget and page size must be at least 1 (got budget: {budget}, page size: {page_size}).")
+        self.provider = provider
+        self.docker_client = docker.DockerClient(base_url=base_url)
+        self.interval = interval
+        self.jitter = jitter
+        self.budget = budget
+        self.page_size = page_size
+        self.stop_event = Event()
+        logger.debug("AntiEntropyScheduler initialized successfully.")
+
+    def start(self):
+        logger.info(f"Starting anti-entropy scheduler (interval: {self.interval}s, jitter: {self.jitter}s, "
+                    f"budget: {self.budget}, page size: {self.page_size})...")
+        self.stop_event.clear()
+        sweeping_thread = Thread(target=self._run, daemon=True)
+        sweeping_thread.start()
+        logger.info("Anti-entropy scheduler thread started.")
+
+    def _run(self):
+        logger.debug("Anti-entropy scheduler thread started.")
+        # Events may have been missed while the service was down, so the first sweep only waits for the jitter
+        delay = random.uniform(a=0, b=self.jitter)
+        while not self.stop_event.wait(delay):
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error(f"Error during anti-entropy sweep: {e}")
+            delay = self.interval + random.uniform(a=0, b=self.jitter)
+        logger.info("Anti-entropy scheduler thread stopped.")
+
+    def _get_expected_subdomains(self) -> Set[AnyStr]:
+        # Records follow the container lifetime (create/destroy), not its running state
+        logger.debug("Collecting subdomains from existing containers...")
+        expected = set()
+        for container in self.docker_client.containers.list(all=True):
+            host = extract_host(container.labels.get(RULE_LABEL, None))
+            subdomain = extract_subdomain(host, self.provider.domain_name) if host else None
+            if subdomain:
+                expected.add(subdomain.lower())
+        logger.debug(f"Expected subdomains: {expected}")
+        return expected
+
+    def sweep(self):
+        logger.info(f"Starting anti-entropy sweep for domain: {self.provider.domain_name}")
+        expected = self._get_expected_subdomains()
+        seen = set()
+        orphans: List[AnyStr] = []
+        orphan_count = 0
+
+        # Only the seen subset of `expected` and at most `budget` orphans are kept across pages.
+        # Deletions are deferred until the stream is exhausted so they cannot shift later pages.
+        for page in self.provider.iter_subdomain_pages(page_size=self.page_size):
+            for subdomain in page:
+                subdomain = subdomain.lower()
+                if subdomain in expected:
+                    seen.add(subdomain)
+                    continue
+                orphan_count += 1
+                if len(orphans) < self.budget:
+                    orphans.append(subdomain)
+
+        # Containers may have been created or destroyed while paging, so candidates are checked again
+        current = self._get_expected_subdomains()
+        missing = sorted((expected - seen) & current)
+        confirmed_orphans = [subdomain for subdomain in orphans if subdomain not in current]
+        orphan_count -= len(orphans) - len(confirmed_orphans)
+        orphans = confirmed_orphans
+        logger.info(f"Sweep found {orphan_count} orphaned and {len(missing)} missing subdomain(s).")
+
+        # Missing records break running services, so they are repaired before orphans are cleaned up
+        mutations = 0
+        for subdomain in missing[:self.budget]:
+            logger.info(f"Adding missing subdomain: {subdomain}")
+            self.provider.add_subdomain(subdomain)
+            mutations += 1
+
+        for subdomain in orphans[:self.budget - mutations]:
+            logger.info(f"Removing orphaned subdomain: {subdomain}")
+            self.provider.remove_subdomain(subdomain)
+            mutations += 1
+
+        pending = orphan_count + len(missing) - mutations
+        if pending:
+            logger.warning(f"Mutation budget of {self.budget} reached; {pending} repair(s) deferred to next sweep.")
+        logger.info(f"Anti-entropy sweep completed with {mutations} mutation(s).")
+
+    def stop(self):
+        logger.info("Stopping AntiEntropyScheduler...")
+        self.stop_event.set()
+        logger.info("AntiEntropyScheduler stopped.")
@@ -1,13 +1,16 @@
-import re
 import queue
 from threading import Thread, Event
 
 import docker
 
 from src.utils.logger import logger
+from src.utils.validators import extract_host
 from src.managers.subdomain_manager import SubdomainManager
 
 
+RULE_LABEL = 'traefik.http.routers.web.rule'
+
+
 class DockerEventListener:
     def __init__(self, subdomain_manager: SubdomainManager, base_url: str = 'unix://var/run/docker.sock'):
         logger.debug("Initializing DockerEventListener...")
@@ -65,12 +68,11 @@ class DockerEventListener:
 
         action = event.get('Action')
         labels = event.get('Actor', {}).get('Attributes', {})
-        rule_label = labels.get('traefik.http.routers.web.rule', None)
+        rule_label = labels.get(RULE_LABEL, None)
 
         if rule_label and action in action_mapping:
-            match = re.search(r"Host\(`(.+?)`\)", rule_label)
-            if match:
-                subdomain = match.group(1)
+            subdomain = extract_host(rule_label)
+            if subdomain:
                 try:
                     logger.info(f"Executing action '{action}' for subdomain: {subdomain}")
                     action_mapping[action](subdomain)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import AnyStr, Dict, Type, Tuple
+from typing import AnyStr, Dict, Iterator, List, Type, Tuple
 
 from src.utils.logger import logger
 from src.utils.validators import validate_domain
@@ -39,3 +39,7 @@ class SubdomainProvider(ABC, APIBaseProvider):
     @abstractmethod
     def remove_subdomain(self, subdomain: str):
         logger.debug(f"Removing subdomain: {subdomain} on provider: {self.name}")
+
+    @abstractmethod
+    def iter_subdomain_pages(self, page_size: int = 100) -> Iterator[List[AnyStr]]:
+        logger.debug(f"Streaming subdomains pointing to '{self.target}' on provider: {self.name}")
@@ -1,7 +1,10 @@
+from typing import AnyStr, Iterator, List
+
 import requests
 
 from src.utils.logger import logger
 from src.utils.decorators import handle_api_errors
+from src.utils.validators import subdomain_of
 from src.providers.abstract import SubdomainProvider
 
 
@@ -67,6 +70,31 @@ class CloudflareProvider(SubdomainProvider):
         except requests.RequestException as e:
             logger.error(f"Failed to remove subdomain '{subdomain}' from domain '{self.domain_name}': {e}")
 
+    def iter_subdomain_pages(self, page_size: int = 100) -> Iterator[List[AnyStr]]:
+        logger.debug(f"Streaming CNAME records pointing to '{self.target}' in domain: {self.domain_name}")
+        zone_id = self._get_zone_id()
+        url = f"{self.base_url}/zones/{zone_id}/dns_records"
+        page = 1
+        while True:
+            params = {"type": "CNAME", "content": self.target, "page": page, "per_page": page_size}
+            logger.debug(f"Sending GET request to URL: {url} with params: {params}")
+            response = self._session.get(url, params=params)
+            response.raise_for_status()
+            payload = response.json()
+            records = payload.get("result", [])
+            if not records:
+                break
+
+            subdomains = [subdomain_of(record["name"], self.domain_name) for record in records]
+            subdomains = [subdomain for subdomain in subdomains if subdomain]
+            logger.debug(f"Page {page}: kept {len(subdomains)} of {len(records)} record(s)")
+            yield subdomains
+
+            total_pages = payload.get("result_info", {}).get("total_pages", page)
+            if page >= total_pages:
+                break
+            page += 1
+
     def _get_zone_id(self):
         logger.debug(f"Fetching zone ID for domain: {self.domain_name}")
         url = f"{self.base_url}/zones"
@@ -1,10 +1,12 @@
 import time
 import random
+from typing import AnyStr, Iterator, List
 
 import ovh
 
 from src.utils.logger import logger
 from src.utils.decorators import handle_api_errors
+from src.utils.validators import subdomain_of
 from src.providers.abstract import SubdomainProvider
 
 
@@ -68,3 +70,30 @@ class OVHProvider(SubdomainProvider):
             self._log_action(action="Removed", subdomain=subdomain)
         except ovh.exceptions.APIError as e:
             logger.error(f"Failed to remove subdomain '{subdomain}' from domain '{self.domain_name}': {e}")
+
+    def iter_subdomain_pages(self, page_size: int = 100) -> Iterator[List[AnyStr]]:
+        logger.debug(f"Streaming CNAME records pointing to '{self.target}' in domain: {self.domain_name}")
+        # The listing only returns record IDs; details are fetched one page at a time
+        record_ids = self.client.get(f'/domain/zone/{self.domain_name}/record', fieldType='CNAME')
+        for start in range(0, len(record_ids), page_size):
+            if start:
+                delay = random.uniform(a=0.5, b=1.0)
+                logger.debug(f"Sleeping for {delay} seconds before fetching the next page of records")
+                time.sleep(delay)
+
+            page_ids = record_ids[start:start + page_size]
+            subdomains = []
+            for record_id in page_ids:
+                try:
+                    record = self.client.get(f'/domain/zone/{self.domain_name}/record/{record_id}')
+                except ovh.exceptions.APIError as e:
+                    logger.error(f"Failed to fetch record ID {record_id} in domain '{self.domain_name}': {e}")
+                    continue
+                if not record.get('subDomain') or record.get('target', '').rstrip('.') != self.target:
+                    continue
+                # Same hostname check as Cloudflare, so wildcard and underscore labels are never swept
+                subdomain = subdomain_of(f"{record['subDomain']}.{self.domain_name}", self.domain_name)
+                if subdomain:
+                    subdomains.append(subdomain)
+            logger.debug(f"Kept {len(subdomains)} of {len(page_ids)} record(s) from page starting at {start}")
+            yield subdomains
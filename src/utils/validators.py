@@ -1,3 +1,4 @@
+import re
 from typing import Optional, AnyStr
 
 import validators
@@ -36,3 +37,26 @@ def extract_subdomain(full_domain: AnyStr, base_domain: AnyStr) -> Optional[AnyS
 
     logger.debug(f"No subdomain extracted from full_domain: {full_domain}")
     return None
+
+
+def extract_host(rule_label: Optional[AnyStr]) -> Optional[AnyStr]:
+    logger.debug(f"Extracting host from rule label: {rule_label}")
+    if not rule_label:
+        return None
+
+    match = re.search(r"Host\(`(.+?)`\)", rule_label)
+    if match:
+        host = match.group(1)
+        logger.debug(f"Extracted host: {host}")
+        return host
+
+    logger.debug(f"No host found in rule label: {rule_label}")
+    return None
+
+
+def subdomain_of(full_domain: AnyStr, base_domain: AnyStr) -> Optional[AnyStr]:
+    # Quiet variant of extract_subdomain for zone records, only valid hostnames strictly below base_domain are kept
+    suffix = f'.{base_domain}'
+    if not full_domain.endswith(suffix) or not validators.hostname(full_domain):
+        return None
+    return full_domain[:-len(suffix)]
@@ -0,0 +1,75 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.managers.anti_entropy_scheduler import AntiEntropyScheduler
+from src.managers.docker_event_listener import RULE_LABEL
+
+
+class FakeProvider:
+    domain_name = 'example.com'
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.added = []
+        self.removed = []
+
+    def iter_subdomain_pages(self, page_size=100):
+        yield from self.pages
+
+    def add_subdomain(self, subdomain):
+        self.added.append(subdomain)
+
+    def remove_subdomain(self, subdomain):
+        self.removed.append(subdomain)
+
+
+def container(host=None):
+    return MagicMock(labels={RULE_LABEL: f"Host(`{host}`)"} if host else {})
+
+
+@pytest.fixture
+def docker_client():
+    with patch('src.managers.anti_entropy_scheduler.docker.DockerClient') as client_cls:
+        yield client_cls.return_value
+
+
+def test_sweep_adds_missing_and_removes_orphans(docker_client):
+    docker_client.containers.list.return_value = [container('a.example.com'), container('b.example.com'), container()]
+    provider = FakeProvider([['a', 'x'], ['y']])
+
+    AntiEntropyScheduler(provider).sweep()
+
+    docker_client.containers.list.assert_called_with(all=True)
+    assert provider.added == ['b']
+    assert provider.removed == ['x', 'y']
+
+
+def test_sweep_adds_missing_before_orphans_within_budget(docker_client):
+    docker_client.containers.list.return_value = [container('a.example.com'), container('b.example.com')]
+    provider = FakeProvider([['x', 'y'], ['z']])
+
+    AntiEntropyScheduler(provider, budget=3).sweep()
+
+    assert provider.added == ['a', 'b']
+    assert provider.removed == ['x']
+
+
+def test_sweep_rechecks_containers_before_mutating(docker_client):
+    # 'new' is created and 'gone' is destroyed while the zone is being paged
+    docker_client.containers.list.side_effect = [
+        [container('gone.example.com')],
+        [container('new.example.com')],
+    ]
+    provider = FakeProvider([['new']])
+
+    AntiEntropyScheduler(provider).sweep()
+
+    assert provider.added == []
+    assert provider.removed == []
+
+
+@pytest.mark.parametrize('budget, page_size', [(0, 100), (-1, 100), (20, 0)])
+def test_rejects_budget_or_page_size_below_one(docker_client, budget, page_size):
+    with pytest.raises(ValueError):
+        AntiEntropyScheduler(FakeProvider([]), budget=budget, page_size=page_size)
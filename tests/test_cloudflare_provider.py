@@ -0,0 +1,39 @@
+from unittest.mock import MagicMock
+
+from src.providers.cloudflare_provider import CloudflareProvider
+
+
+def response(payload):
+    mock = MagicMock()
+    mock.json.return_value = payload
+    return mock
+
+
+def page(names, total_pages):
+    return response({
+        "result": [{"name": name} for name in names],
+        "result_info": {"total_pages": total_pages},
+    })
+
+
+def make_provider(*pages):
+    provider = CloudflareProvider(api_token='token', domain_name='example.com', target='proxy.example.com')
+    provider._session = MagicMock()
+    provider._session.get.side_effect = [response({"result": [{"id": "zone"}]}), *pages]
+    return provider
+
+
+def test_iter_subdomain_pages_stops_at_total_pages():
+    provider = make_provider(page(['a.example.com', 'example.com', '*.example.com', '_acme-challenge.example.com'], 2), page(['b.example.com'], 2))
+
+    assert list(provider.iter_subdomain_pages(page_size=2)) == [['a'], ['b']]
+    assert provider._session.get.call_count == 3
+    params = provider._session.get.call_args.kwargs['params']
+    assert params == {"type": "CNAME", "content": "proxy.example.com", "page": 2, "per_page": 2}
+
+
+def test_iter_subdomain_pages_stops_on_empty_page():
+    provider = make_provider(page(['a.example.com'], 5), page([], 5))
+
+    assert list(provider.iter_subdomain_pages()) == [['a']]
+    assert provider._session.get.call_count == 3
@@ -0,0 +1,31 @@
+from unittest.mock import patch
+
+import ovh
+
+from src.providers.ovh_provider import OVHProvider
+
+
+@patch('src.providers.ovh_provider.time.sleep')
+@patch('src.providers.ovh_provider.ovh.Client')
+def test_iter_subdomain_pages_filters_target_and_non_hostnames_and_skips_failed_records(client_cls, sleep):
+    records = {
+        1: {'subDomain': 'a', 'target': 'proxy.example.com.'},
+        2: {'subDomain': 'b', 'target': 'other.example.com.'},
+        4: {'subDomain': 'd', 'target': 'proxy.example.com'},
+        5: {'subDomain': '*', 'target': 'proxy.example.com.'},
+        6: {'subDomain': '_acme-challenge', 'target': 'proxy.example.com.'},
+    }
+
+    def get(path, **kwargs):
+        if path.endswith('/record'):
+            return [1, 2, 3, 4, 5, 6]
+        record_id = int(path.rsplit('/', 1)[-1])
+        if record_id not in records:
+            raise ovh.exceptions.APIError("Record not found")
+        return records[record_id]
+
+    client_cls.return_value.get.side_effect = get
+    provider = OVHProvider('key', 'secret', 'consumer', domain_name='example.com', target='proxy.example.com')
+
+    assert list(provider.iter_subdomain_pages(page_size=3)) == [['a'], ['d']]
+    assert sleep.call_count == 1